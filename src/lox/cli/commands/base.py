@@ -55,7 +55,11 @@ class BaseCommand(ABC):
 
     def cleanup(self) -> None:
         """Cleanup resources after command execution."""
-        pass
+        from lox.core.cryptography import clear_cipher_cache
+
+        clear_cipher_cache()
+        if self.vault is not None:
+            self.vault.clear_key_cache()
 
     def run(self, args: Namespace) -> int:
         """Main entry point for command execution."""
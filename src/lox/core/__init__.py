@@ -5,7 +5,7 @@ from .exceptions import (ConfigurationError, DecryptionError, EncryptionError,
                          LoxError, PasswordGenerationError, SecurityError,
                          ValidationError, VaultError, VaultNotFoundError,
                          VaultOperationError)
-from .services import VaultManager, generate_password
+from .services import VaultManager, generate_password, generate_passwords
 from .storage import Vault
 
 __all__ = [
@@ -13,6 +13,7 @@ __all__ = [
     "encrypt_data",
     "decrypt_data",
     "generate_password",
+    "generate_passwords",
     "VaultManager",
     "LoxError",
     "VaultError",
@@ -1,6 +1,12 @@
 """Cryptography module for Lox password manager."""
 
-from .encryption import decrypt_data, encrypt_data
-from .key_derivation import derive_key
+from .encryption import clear_cipher_cache, decrypt_data, encrypt_data
+from .key_derivation import derive_key, derive_key_pbkdf2
 
-__all__ = ["derive_key", "encrypt_data", "decrypt_data"]
+__all__ = [
+    "derive_key",
+    "derive_key_pbkdf2",
+    "encrypt_data",
+    "decrypt_data",
+    "clear_cipher_cache",
+]
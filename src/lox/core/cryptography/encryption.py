@@ -1,5 +1,6 @@
 """Encryption and decryption functions using Fernet."""
 
+import functools
 from typing import Union
 
 from cryptography.fernet import Fernet, InvalidToken
@@ -7,6 +8,17 @@ from cryptography.fernet import Fernet, InvalidToken
 from ..exceptions import DecryptionError, EncryptionError
 
 
+@functools.lru_cache(maxsize=4)
+def _fernet(key: bytes) -> Fernet:
+    """Return a Fernet instance for the key, reused across calls."""
+    return Fernet(key)
+
+
+def clear_cipher_cache() -> None:
+    """Drop cached Fernet instances so no key material outlives its use."""
+    _fernet.cache_clear()
+
+
 def encrypt_data(data: Union[str, bytes], key: bytes) -> bytes:
     """
     Encrypt data using the derived key.
@@ -25,8 +37,7 @@ def encrypt_data(data: Union[str, bytes], key: bytes) -> bytes:
         if isinstance(data, str):
             data = data.encode("utf-8")
 
-        fernet = Fernet(key)
-        encrypted_data = fernet.encrypt(data)
+        encrypted_data = _fernet(key).encrypt(data)
         return encrypted_data
 
     except Exception as e:
@@ -48,8 +59,7 @@ def decrypt_data(encrypted_data: bytes, key: bytes) -> str:
         DecryptionError: If decryption fails or authentication fails
     """
     try:
-        fernet = Fernet(key)
-        decrypted_data = fernet.decrypt(encrypted_data)
+        decrypted_data = _fernet(key).decrypt(encrypted_data)
         return decrypted_data.decode("utf-8")
 
     except InvalidToken:
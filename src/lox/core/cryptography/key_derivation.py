@@ -1,9 +1,10 @@
 """Key derivation functions for password-based encryption."""
 
-import base64
+import binascii
 import os
 from typing import Tuple
 
+from argon2.low_level import Type, hash_secret_raw
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
@@ -11,14 +12,64 @@ SALT_LENGTH = 16
 KEY_LENGTH = 32
 PBKDF2_ITERATIONS = 100000
 
+ARGON2_TIME_COST = 3
+ARGON2_MEMORY_COST = 65536  # KiB
+ARGON2_PARALLELISM = 2
+
+# Maps the standard base64 alphabet onto the urlsafe one expected by Fernet
+_B64_URLSAFE = bytes.maketrans(b"+/", b"-_")
+
+
+def _encode_key(key_material: bytes) -> bytes:
+    """Encode raw key material as a urlsafe base64 Fernet key."""
+    return binascii.b2a_base64(key_material, newline=False).translate(_B64_URLSAFE)
+
 
 def derive_key(
     master_password: str,
     salt: bytes = None,
+    time_cost: int = ARGON2_TIME_COST,
+    memory_cost: int = ARGON2_MEMORY_COST,
+    parallelism: int = ARGON2_PARALLELISM,
+) -> Tuple[bytes, bytes]:
+    """
+    Derive a cryptographic key from a master password using Argon2id.
+
+    Args:
+        master_password: The user's master password
+        salt: Optional salt. If None, a new salt is generated.
+        time_cost: Number of Argon2 iterations
+        memory_cost: Memory usage in KiB
+        parallelism: Number of parallel lanes
+
+    Returns:
+        Tuple of (key, salt) - The derived key and the salt used
+    """
+    if salt is None:
+        salt = os.urandom(SALT_LENGTH)
+
+    key_material = hash_secret_raw(
+        master_password.encode(),
+        salt,
+        time_cost=time_cost,
+        memory_cost=memory_cost,
+        parallelism=parallelism,
+        hash_len=KEY_LENGTH,
+        type=Type.ID,
+    )
+
+    return _encode_key(key_material), salt
+
+
+def derive_key_pbkdf2(
+    master_password: str,
+    salt: bytes = None,
 ) -> Tuple[bytes, bytes]:
     """
     Derive a cryptographic key from a master password using PBKDF2.
 
+    Only used to open legacy (version 1) vaults.
+
     Args:
         master_password: The user's master password
         salt: Optional salt. If None, a new salt is generated.
@@ -37,6 +88,5 @@ def derive_key(
     )
 
     key_material = kdf.derive(master_password.encode())
-    key = base64.urlsafe_b64encode(key_material)
 
-    return key, salt
+    return _encode_key(key_material), salt
@@ -1,8 +1,20 @@
 """Data models for vault structure."""
 
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
+
+# Version 2.0 stores credential timestamps as integer unix timestamps,
+# version 1.0 stored them as ISO-8601 strings.
+SCHEMA_VERSION = "2.0"
+
+
+def _parse_timestamp(value: Union[int, float, str]) -> datetime:
+    """Parse a stored timestamp, accepting legacy ISO-8601 strings."""
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    return datetime.fromtimestamp(value)
 
 
 @dataclass
@@ -17,6 +29,18 @@ class Credential:
     updated: datetime = field(default_factory=datetime.now)
 
 
+def _credential_to_dict(cred: Credential) -> Dict[str, Any]:
+    """Convert a credential to its JSON-serializable form."""
+    return {
+        "password": cred.password,
+        "username": cred.username,
+        "url": cred.url,
+        "notes": cred.notes,
+        "created": int(cred.created.timestamp()),
+        "updated": int(cred.updated.timestamp()),
+    }
+
+
 @dataclass
 class VaultData:
     """Represents the complete vault data structure."""
@@ -24,9 +48,9 @@ class VaultData:
     services: Dict[str, Credential] = field(default_factory=dict)
     metadata: Dict[str, Any] = field(
         default_factory=lambda: {
-            "version": "1.0",
-            "created": datetime.now().isoformat(),
-            "updated": datetime.now().isoformat(),
+            "version": SCHEMA_VERSION,
+            "created": int(time.time()),
+            "updated": int(time.time()),
         }
     )
 
@@ -34,17 +58,9 @@ class VaultData:
         """Convert to dictionary for JSON serialization."""
         return {
             "services": {
-                name: {
-                    "password": cred.password,
-                    "username": cred.username,
-                    "url": cred.url,
-                    "notes": cred.notes,
-                    "created": cred.created.isoformat(),
-                    "updated": cred.updated.isoformat(),
-                }
-                for name, cred in self.services.items()
+                name: _credential_to_dict(cred) for name, cred in self.services.items()
             },
-            "metadata": self.metadata,
+            "metadata": {**self.metadata, "version": SCHEMA_VERSION},
         }
 
     @classmethod
@@ -59,12 +75,8 @@ class VaultData:
                 username=cred_data.get("username"),
                 url=cred_data.get("url"),
                 notes=cred_data.get("notes"),
-                created=datetime.fromisoformat(
-                    cred_data.get("created", datetime.now().isoformat())
-                ),
-                updated=datetime.fromisoformat(
-                    cred_data.get("updated", datetime.now().isoformat())
-                ),
+                created=_parse_timestamp(cred_data.get("created", time.time())),
+                updated=_parse_timestamp(cred_data.get("updated", time.time())),
             )
 
         return vault_data
@@ -1,6 +1,6 @@
 """Core services for Lox password manager."""
 
-from .password_generator import generate_password
+from .password_generator import generate_password, generate_passwords
 from .vault_manager import VaultManager
 
-__all__ = ["generate_password", "VaultManager"]
+__all__ = ["generate_password", "generate_passwords", "VaultManager"]
@@ -1,47 +1,73 @@
 """Password generation service."""
 
-import secrets
+import os
 import string
+from typing import List
 
 from ..exceptions import PasswordGenerationError
 
 
-def generate_password(
+def _build_alphabet(
+    use_symbols: bool,
+    use_digits: bool,
+    use_uppercase: bool,
+    exclude_similar: bool,
+) -> str:
+    """Build the character set passwords are drawn from."""
+    lowercase_letters = string.ascii_lowercase
+
+    uppercase_letters = string.ascii_uppercase if use_uppercase else ""
+    if exclude_similar and use_uppercase:
+        uppercase_letters = "".join(c for c in uppercase_letters if c not in "IO")
+
+    digits = string.digits if use_digits else ""
+    if exclude_similar and use_digits:
+        digits = "".join(c for c in digits if c not in "01")
+
+    symbols = "!@#$%^&*()_+-=[]{}|;:,.<>?" if use_symbols else ""
+
+    return lowercase_letters + uppercase_letters + digits + symbols
+
+
+def _fill_from_entropy(entropy: bytes, alphabet: str) -> str:
+    """
+    Map random bytes onto the alphabet without modulo bias.
+
+    Bytes at or above the largest multiple of the alphabet size are
+    rejected, so the result may be shorter than the entropy.
+    """
+    size = len(alphabet)
+    limit = 256 - 256 % size
+    return "".join(alphabet[b % size] for b in entropy if b < limit)
+
+
+def generate_passwords(
+    count: int,
     length: int = 16,
     use_symbols: bool = True,
     use_digits: bool = True,
     use_uppercase: bool = True,
     exclude_similar: bool = True,
-) -> str:
+) -> List[str]:
     """
-    Generate a secure random password.
+    Generate several secure random passwords from one batch of entropy.
 
     Args:
-        length: Length of the password (default: 16)
+        count: Number of passwords to generate
+        length: Length of each password (default: 16)
         use_symbols: Include symbols (default: True)
         use_digits: Include digits (default: True)
         use_uppercase: Include uppercase letters (default: True)
         exclude_similar: Exclude similar characters like 1lI0O (default: True)
 
     Returns:
-        Generated password string
+        List of generated password strings
 
     Raises:
-        PasswordGenerationError: If no character sets are selected or length is invalid
+        PasswordGenerationError: If no character sets are selected or length
+            or count is invalid
     """
-    lowercase_letters = string.ascii_lowercase
-
-    uppercase_letters = string.ascii_uppercase if use_uppercase else ""
-    if exclude_similar and use_uppercase:
-        uppercase_letters = "".join(c for c in uppercase_letters if c not in "IO")
-
-    digits = string.digits if use_digits else ""
-    if exclude_similar and use_digits:
-        digits = "".join(c for c in digits if c not in "01")
-
-    symbols = "!@#$%^&*()_+-=[]{}|;:,.<>?" if use_symbols else ""
-
-    all_chars = lowercase_letters + uppercase_letters + digits + symbols
+    all_chars = _build_alphabet(use_symbols, use_digits, use_uppercase, exclude_similar)
 
     if not all_chars:
         raise PasswordGenerationError(
@@ -55,8 +81,49 @@ def generate_password(
     if length > 128:
         raise PasswordGenerationError("Password length cannot exceed 128 characters")
 
+    if count < 1:
+        raise PasswordGenerationError("Password count must be at least 1")
+
     try:
-        password = "".join(secrets.choice(all_chars) for _ in range(length))
-        return password
+        total = count * length
+        pool = ""
+        while len(pool) < total:
+            # Over-draw so rejected bytes rarely require a second syscall
+            pool += _fill_from_entropy(os.urandom((total - len(pool)) * 3), all_chars)
+
+        return [pool[i : i + length] for i in range(0, total, length)]
     except Exception as e:
         raise PasswordGenerationError(f"Failed to generate password: {e}") from e
+
+
+def generate_password(
+    length: int = 16,
+    use_symbols: bool = True,
+    use_digits: bool = True,
+    use_uppercase: bool = True,
+    exclude_similar: bool = True,
+) -> str:
+    """
+    Generate a secure random password.
+
+    Args:
+        length: Length of the password (default: 16)
+        use_symbols: Include symbols (default: True)
+        use_digits: Include digits (default: True)
+        use_uppercase: Include uppercase letters (default: True)
+        exclude_similar: Exclude similar characters like 1lI0O (default: True)
+
+    Returns:
+        Generated password string
+
+    Raises:
+        PasswordGenerationError: If no character sets are selected or length is invalid
+    """
+    return generate_passwords(
+        1,
+        length=length,
+        use_symbols=use_symbols,
+        use_digits=use_digits,
+        use_uppercase=use_uppercase,
+        exclude_similar=exclude_similar,
+    )[0]
@@ -21,6 +21,14 @@ class VaultManager:
         """
         self._vault = vault
 
+    @staticmethod
+    def _services(vault_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the services mapping of vault data, creating it if missing."""
+        services = vault_data.get("services")
+        if services is None:
+            services = vault_data["services"] = {}
+        return services
+
     def get_vault_data(self, master_password: str) -> Dict[str, Any]:
         """
         Load and return vault data.
@@ -57,10 +65,11 @@ class VaultManager:
         Raises:
             VaultError: If service already exists
         """
-        if name in vault_data.get("services", {}):
+        services = self._services(vault_data)
+        if name in services:
             raise VaultError(f"Service '{name}' already exists in vault.")
 
-        vault_data.setdefault("services", {})[name] = {"password": password}
+        services[name] = {"password": password}
 
     def update_password_entry(
         self, name: str, password: str, vault_data: Dict[str, Any]
@@ -76,10 +85,11 @@ class VaultManager:
         Raises:
             VaultError: If service doesn't exist
         """
-        if name not in vault_data.get("services", {}):
+        services = self._services(vault_data)
+        if name not in services:
             raise VaultError(f"Service '{name}' not found in vault.")
 
-        vault_data["services"][name]["password"] = password
+        services[name]["password"] = password
 
     def delete_password_entry(self, name: str, vault_data: Dict[str, Any]) -> bool:
         """
@@ -92,8 +102,9 @@ class VaultManager:
         Returns:
             True if entry was deleted, False if not found
         """
-        if name in vault_data.get("services", {}):
-            del vault_data["services"][name]
+        services = self._services(vault_data)
+        if name in services:
+            del services[name]
             return True
         return False
 
@@ -146,7 +157,7 @@ class VaultManager:
         Returns:
             List of service names
         """
-        return list(vault_data.get("services", {}).keys())
+        return list(self._services(vault_data))
 
     def get_password(
         self, service_name: str, vault_data: Dict[str, Any]
@@ -161,5 +172,5 @@ class VaultManager:
         Returns:
             Password string or None if service not found
         """
-        service = vault_data.get("services", {}).get(service_name)
+        service = self._services(vault_data).get(service_name)
         return service.get("password") if service else None
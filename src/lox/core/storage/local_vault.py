@@ -1,16 +1,39 @@
 """Local encrypted vault file storage implementation."""
 
+import hashlib
+import hmac
 import json
 import logging
-import os
+import mmap
+import stat
+import struct
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+from ..cryptography import (decrypt_data, derive_key, derive_key_pbkdf2,
+                            encrypt_data)
+from ..cryptography.key_derivation import (ARGON2_MEMORY_COST,
+                                           ARGON2_PARALLELISM,
+                                           ARGON2_TIME_COST)
+from lox.utils.files import atomic_write
 
-from ..cryptography import decrypt_data, derive_key, encrypt_data
 from ..exceptions import VaultNotFoundError, VaultOperationError
 
 logger = logging.getLogger(__name__)
 
+# Version 2 vaults start with this magic followed by the Argon2id parameters
+# (time cost, memory cost, parallelism) and the salt length. Version 1 vaults
+# start directly with the salt length and use PBKDF2.
+VAULT_MAGIC = b"LOX\x02"
+_V2_HEADER = struct.Struct(">4sIIII")
+_DEFAULT_KDF_PARAMS = (ARGON2_TIME_COST, ARGON2_MEMORY_COST, ARGON2_PARALLELISM)
+# Upper bounds on the Argon2 parameters accepted from a vault header, which
+# is not authenticated and may come from the cloud copy
+_MAX_TIME_COST = 10 * ARGON2_TIME_COST
+_MAX_MEMORY_COST = 1024 * 1024  # KiB (1 GiB)
+_MAX_PARALLELISM = 8 * ARGON2_PARALLELISM
+_MIN_SALT_LENGTH = 8
+
 
 class Vault:
     """Manages local encrypted vault file storage."""
@@ -30,12 +53,82 @@ class Vault:
                 Path.home() / ".config" / "loxpasswordmanager" / "vault.enc"
             )
 
+        # (password digest, salt, kdf_params, key) of the last key derivation
+        self._key_cache: Optional[Tuple[bytes, bytes, Optional[tuple], bytes]] = None
+
         self._ensure_data_dir()
 
     def _ensure_data_dir(self) -> None:
         """Ensure the data directory exists."""
         self.vault_path.parent.mkdir(parents=True, exist_ok=True)
 
+    def _atomic_write(self, payload: bytes) -> None:
+        """
+        Write payload to the vault file atomically.
+
+        The vault keeps its current permissions (0600 for a new vault).
+
+        Args:
+            payload: Bytes to write
+        """
+        try:
+            mode = stat.S_IMODE(self.vault_path.stat().st_mode)
+        except FileNotFoundError:
+            mode = 0o600
+
+        atomic_write(self.vault_path, payload, mode)
+
+    def _derive_key(
+        self,
+        master_password: str,
+        salt: Optional[bytes] = None,
+        kdf_params: Optional[tuple] = _DEFAULT_KDF_PARAMS,
+    ) -> Tuple[bytes, bytes]:
+        """
+        Derive the vault key, reusing the last derivation for the same inputs.
+
+        Without a salt, the salt of the last derivation is reused when the
+        password and parameters match, so a load followed by a save only
+        runs the KDF once.
+
+        Args:
+            master_password: Master password
+            salt: Salt from the vault header, or None to pick one
+            kdf_params: Argon2id (time_cost, memory_cost, parallelism), or
+                None for a legacy PBKDF2 vault
+
+        Returns:
+            Tuple of (key, salt)
+        """
+        password_digest = hashlib.sha256(master_password.encode()).digest()
+        cached = self._key_cache
+        if (
+            cached is not None
+            and cached[2] == kdf_params
+            and (salt is None or cached[1] == salt)
+            and hmac.compare_digest(cached[0], password_digest)
+        ):
+            return cached[3], cached[1]
+
+        if kdf_params is None:
+            key, salt = derive_key_pbkdf2(master_password, salt=salt)
+        else:
+            time_cost, memory_cost, parallelism = kdf_params
+            key, salt = derive_key(
+                master_password,
+                salt=salt,
+                time_cost=time_cost,
+                memory_cost=memory_cost,
+                parallelism=parallelism,
+            )
+
+        self._key_cache = (password_digest, salt, kdf_params, key)
+        return key, salt
+
+    def clear_key_cache(self) -> None:
+        """Forget the cached derived key."""
+        self._key_cache = None
+
     def vault_exists(self) -> bool:
         """Check if vault file exists."""
         return self.vault_path.exists()
@@ -78,14 +171,15 @@ class Vault:
             VaultOperationError: If encryption or save fails
         """
         try:
-            key, salt = derive_key(master_password)
-            json_data = json.dumps(data, indent=2)
+            key, salt = self._derive_key(
+                master_password, kdf_params=_DEFAULT_KDF_PARAMS
+            )
+            json_data = json.dumps(data, separators=(",", ":"), ensure_ascii=False)
             encrypted_data = encrypt_data(json_data, key)
 
-            with open(self.vault_path, "wb") as f:
-                f.write(len(salt).to_bytes(4, "big"))
-                f.write(salt)
-                f.write(encrypted_data)
+            header = _V2_HEADER.pack(VAULT_MAGIC, *_DEFAULT_KDF_PARAMS, len(salt))
+            payload = header + salt + encrypted_data
+            self._atomic_write(payload)
 
             logger.info("Vault saved successfully to %s", self.vault_path)
             return True
@@ -99,6 +193,53 @@ class Vault:
             logger.error(error_msg)
             raise VaultOperationError(error_msg) from e
 
+    @staticmethod
+    def _parse_header(blob: Any) -> Tuple[bytes, bytes, Optional[tuple]]:
+        """
+        Split a vault blob into its salt, ciphertext and KDF parameters.
+
+        Args:
+            blob: Raw vault file contents (bytes or a read-only mmap)
+
+        Returns:
+            Tuple of (salt, encrypted_data, kdf_params), where kdf_params is
+            None for a legacy PBKDF2 vault
+
+        Raises:
+            VaultOperationError: If the header holds invalid KDF parameters
+                or salt length
+        """
+        if blob[:4] == VAULT_MAGIC:
+            _, time_cost, memory_cost, parallelism, salt_length = (
+                _V2_HEADER.unpack_from(blob)
+            )
+            if (
+                not 1 <= time_cost <= _MAX_TIME_COST
+                or not 1 <= parallelism <= _MAX_PARALLELISM
+                or not 8 * parallelism <= memory_cost <= _MAX_MEMORY_COST
+            ):
+                raise VaultOperationError(
+                    "Invalid vault header: unsupported key derivation parameters "
+                    f"(time_cost={time_cost}, memory_cost={memory_cost}, "
+                    f"parallelism={parallelism})."
+                )
+            offset = _V2_HEADER.size
+            kdf_params = (time_cost, memory_cost, parallelism)
+        else:
+            # Legacy version 1 vault, re-saved as version 2 on next write
+            salt_length = int.from_bytes(blob[:4], "big")
+            offset = 4
+            kdf_params = None
+
+        if not _MIN_SALT_LENGTH <= salt_length <= len(blob) - offset:
+            raise VaultOperationError(
+                f"Invalid vault header: salt length {salt_length} is out of range."
+            )
+
+        salt = blob[offset : offset + salt_length]
+        encrypted_data = blob[offset + salt_length :]
+        return salt, encrypted_data, kdf_params
+
     def load_vault(self, master_password: str) -> Dict[str, Any]:
         """
         Load and decrypt the vault data.
@@ -120,12 +261,14 @@ class Vault:
             )
 
         try:
-            with open(self.vault_path, "rb") as f:
-                salt_length = int.from_bytes(f.read(4), "big")
-                salt = f.read(salt_length)
-                encrypted_data = f.read()
-
-            key, _ = derive_key(master_password, salt=salt)
+            # Slicing the mapping copies the ciphertext out of the page cache
+            # once, instead of reading the whole file and then slicing it
+            with open(self.vault_path, "rb") as f, mmap.mmap(
+                f.fileno(), 0, access=mmap.ACCESS_READ
+            ) as blob:
+                salt, encrypted_data, kdf_params = self._parse_header(blob)
+
+            key, _ = self._derive_key(master_password, salt, kdf_params)
             decrypted_json = decrypt_data(encrypted_data, key)
 
             vault_data = json.loads(decrypted_json)
@@ -133,6 +276,9 @@ class Vault:
             logger.info("Vault loaded successfully from %s", self.vault_path)
             return vault_data
 
+        except VaultOperationError as e:
+            logger.error(str(e))
+            raise
         except (ValueError, KeyError, TypeError) as e:
             error_msg = (
                 "Failed to decrypt vault. The master password may be incorrect "
@@ -189,9 +335,7 @@ class Vault:
         """
         try:
             self._ensure_data_dir()
-
-            with open(self.vault_path, "wb") as f:
-                f.write(cloud_bytes_content)
+            self._atomic_write(cloud_bytes_content)
 
             logger.info("Local vault synchronized with cloud version")
             return True
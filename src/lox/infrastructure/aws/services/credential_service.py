@@ -10,9 +10,39 @@ from typing import Dict, Optional, Tuple
 import keyring
 from keyring.errors import KeyringError
 
+from lox.utils.files import atomic_write
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
+def _dumps(data: Dict, indent: bool = False) -> bytes:
+    """
+    Serialize credentials to JSON bytes, using orjson when available.
+
+    With indent, the output is pretty-printed and ends with a newline.
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE if indent else 0
+        return orjson.dumps(data, option=option)
+    if indent:
+        return (json.dumps(data, indent=2) + "\n").encode("utf-8")
+    return json.dumps(data).encode("utf-8")
+
+
+def _loads(data) -> Dict:
+    """Deserialize credentials from JSON, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 class StorageBackend(Enum):
     KEYRING = "keyring"
     ENV_FILE = "env_file"
@@ -29,8 +59,19 @@ class AWSCredentialService:
 
     def __init__(self, service_name: str = "LoxPasswordManager"):
         self.service_name = service_name
+        self._keyring_service = f"{service_name}-credentials"
+        self._user: Optional[str] = None
         self._used_backend: Optional[StorageBackend] = None
         self._backend_preference = [StorageBackend.KEYRING, StorageBackend.ENV_FILE]
+        self._cache: Optional[Dict[str, str]] = None
+        self._store_methods = {
+            StorageBackend.KEYRING: self._store_keyring,
+            StorageBackend.ENV_FILE: self._store_env_file,
+        }
+        self._retrieve_methods = {
+            StorageBackend.KEYRING: self._retrieve_keyring,
+            StorageBackend.ENV_FILE: self._retrieve_env_file,
+        }
 
     def prompt_for_credentials(self) -> Dict[str, str]:
         """
@@ -83,6 +124,7 @@ class AWSCredentialService:
             try:
                 if self._store_with_backend(backend, credential_data):
                     self._used_backend = backend
+                    self._cache = credential_data
                     logger.info("Credentials stored using %s backend", backend.value)
                     return True
             except Exception as e:
@@ -95,13 +137,19 @@ class AWSCredentialService:
         """
         Retrieve stored AWS credentials.
 
+        The first successful lookup is cached for the lifetime of the service.
+
         Returns:
             Optional[Dict]: Stored credentials or None if not found
         """
+        if self._cache is not None:
+            return self._cache
+
         for backend in self._backend_preference:
             try:
                 creds = self._retrieve_from_backend(backend)
                 if creds:
+                    self._cache = creds
                     return creds
             except Exception as e:
                 logger.debug("Retrieval from %s failed: %s", backend.value, e)
@@ -114,9 +162,8 @@ class AWSCredentialService:
         success = True
 
         try:
-            user = getpass.getuser()
-            keyring.delete_password(f"{self.service_name}-credentials", user)
-        except KeyringError:
+            keyring.delete_password(self._keyring_service, self._get_user())
+        except (KeyringError, KeyError, OSError):  # getuser() raises KeyError/OSError
             success = False
 
         try:
@@ -127,30 +174,28 @@ class AWSCredentialService:
             success = False
 
         self._used_backend = None
+        self._cache = None
         return success
 
     def _store_with_backend(self, backend: StorageBackend, data: Dict) -> bool:
         """Store credentials using specific backend."""
-        methods = {
-            StorageBackend.KEYRING: self._store_keyring,
-            StorageBackend.ENV_FILE: self._store_env_file,
-        }
-        return methods[backend](data)
+        return self._store_methods[backend](data)
 
     def _retrieve_from_backend(self, backend: StorageBackend) -> Optional[Dict]:
         """Retrieve credentials from specific backend."""
-        methods = {
-            StorageBackend.KEYRING: self._retrieve_keyring,
-            StorageBackend.ENV_FILE: self._retrieve_env_file,
-        }
-        return methods[backend]()
+        return self._retrieve_methods[backend]()
+
+    def _get_user(self) -> str:
+        """Get the keyring user name, resolving it on first use."""
+        if self._user is None:
+            self._user = getpass.getuser()
+        return self._user
 
     def _store_keyring(self, data: Dict) -> bool:
         """Store credentials in system keyring."""
         try:
-            user = getpass.getuser()
             keyring.set_password(
-                f"{self.service_name}-credentials", user, json.dumps(data)
+                self._keyring_service, self._get_user(), _dumps(data).decode("utf-8")
             )
             return True
         except KeyringError as e:
@@ -160,24 +205,27 @@ class AWSCredentialService:
     def _retrieve_keyring(self) -> Optional[Dict]:
         """Retrieve credentials from system keyring."""
         try:
-            user = getpass.getuser()
-            creds_json = keyring.get_password(f"{self.service_name}-credentials", user)
+            creds_json = keyring.get_password(self._keyring_service, self._get_user())
 
             if creds_json:
-                return json.loads(creds_json)
+                return _loads(creds_json)
         except (KeyringError, json.JSONDecodeError) as e:
             logger.debug("Keyring retrieval failed: %s", e)
 
         return None
 
     def _store_env_file(self, data: Dict) -> bool:
-        """Store credentials in environment file."""
+        """
+        Store credentials in environment file.
+
+        The file is written atomically with owner-only permissions, so a
+        crash never leaves half-written credentials.
+        """
         try:
             env_file = self._get_env_file_path()
             env_file.parent.mkdir(parents=True, exist_ok=True)
 
-            env_file.write_text(json.dumps(data, indent=2))
-            env_file.chmod(0o600)  # Restrict permissions
+            atomic_write(env_file, _dumps(data, indent=True), 0o600)
             return True
         except OSError as e:
             logger.debug("Env file storage failed: %s", e)
@@ -186,9 +234,9 @@ class AWSCredentialService:
     def _retrieve_env_file(self) -> Optional[Dict]:
         """Retrieve credentials from environment file."""
         try:
-            env_file = self._get_env_file_path()
-            if env_file.exists():
-                return json.loads(env_file.read_text())
+            return _loads(self._get_env_file_path().read_bytes())
+        except FileNotFoundError:
+            pass
         except (OSError, json.JSONDecodeError) as e:
             logger.debug("Env file retrieval failed: %s", e)
 
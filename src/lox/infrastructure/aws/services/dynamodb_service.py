@@ -4,9 +4,11 @@ import base64
 import logging
 import time
 import uuid
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
 from boto3.dynamodb.conditions import Key
+from boto3.dynamodb.types import TypeDeserializer
 from botocore.exceptions import ClientError
 
 from lox.core.storage.local_vault import Vault
@@ -14,6 +16,31 @@ from lox.infrastructure.aws.services.sts_service import STSService
 
 logger = logging.getLogger(__name__)
 
+VAULT_RECORD_TYPE = "DATA_VAULT"
+
+# Attributes shared by every uploaded vault item
+_VAULT_ITEM_BASE = {"pk": "VAULT_DATA", "record_type": VAULT_RECORD_TYPE}
+
+_deserializer = TypeDeserializer()
+
+
+def _attribute(item: Dict[str, Any], name: str) -> Any:
+    """Deserialize a single attribute of a low-level DynamoDB item."""
+    value = item.get(name)
+    return _deserializer.deserialize(value) if value is not None else None
+
+
+def _project_vault_items(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Convert a page of raw DynamoDB items into vault metadata."""
+    return [
+        {
+            "common_name": _attribute(item, "common_name"),
+            "timestamp": _attribute(item, "timestamp_ms"),
+            "record_id": _attribute(item, "sk"),
+        }
+        for item in items
+    ]
+
 
 class DynamoDBServiceError(Exception):
     """Exception for DynamoDB service errors."""
@@ -48,29 +75,49 @@ class DynamoDBService:
         try:
             vault = Vault()
             vault_bytes = vault.get_encrypted_vault()
-            base64_vault_data = base64.b64encode(vault_bytes).decode("ascii")
+        except Exception as e:
+            error_msg = f"Unexpected error during upload: {e}"
+            logger.error(error_msg)
+            raise DynamoDBServiceError(error_msg) from e
 
-            item = {
-                "pk": {"S": "VAULT_DATA"},
-                "sk": {"S": str(uuid.uuid4())},
-                "common_name": {"S": common_name},
-                "timestamp_ms": {"N": str(int(time.time() * 1000))},
-                "vault_data": {"S": base64_vault_data},
-                "record_type": {"S": "DATA_VAULT"},
-            }
+        return self.upload_vaults([(common_name, vault_bytes)])
 
-            dynamodb = self.sts_service.get_client_with_assumed_role("dynamodb")
-            response = dynamodb.put_item(
-                TableName=self.table_name,
-                Item=item,
-            )
+    def upload_vaults(self, vaults: List[Tuple[str, bytes]]) -> bool:
+        """
+        Upload several encrypted vaults to DynamoDB in batches.
 
-            if response["ResponseMetadata"]["HTTPStatusCode"] == 200:
-                logger.info("Successfully uploaded vault to DynamoDB")
-                return True
-            else:
-                logger.error("Failed to upload vault. Response: %s", response)
-                return False
+        Items are written through a batch writer, which groups up to 25
+        puts per request and retries unprocessed items.
+
+        Args:
+            vaults: List of (common_name, encrypted vault bytes) pairs
+
+        Returns:
+            bool: True if upload successful
+
+        Raises:
+            DynamoDBServiceError: If upload fails
+        """
+        try:
+            dynamodb = self.sts_service.get_resource_with_assumed_role("dynamodb")
+            table = dynamodb.Table(self.table_name)
+
+            # The batch writer buffers item dicts by reference, so each put
+            # gets its own dict rather than a reused, mutated template
+            with table.batch_writer(overwrite_by_pkeys=["pk", "sk"]) as batch:
+                for common_name, vault_bytes in vaults:
+                    batch.put_item(
+                        Item={
+                            **_VAULT_ITEM_BASE,
+                            "sk": str(uuid.uuid4()),
+                            "common_name": common_name,
+                            "timestamp_ms": int(time.time() * 1000),
+                            "vault_data": vault_bytes,
+                        }
+                    )
+
+            logger.info("Successfully uploaded %d vault(s) to DynamoDB", len(vaults))
+            return True
 
         except ClientError as e:
             error_msg = f"DynamoDB upload failed: {e.response['Error']}"
@@ -97,7 +144,7 @@ class DynamoDBService:
 
             response = table.query(
                 IndexName="TimestampIndex",
-                KeyConditionExpression=Key("record_type").eq("DATA_VAULT"),
+                KeyConditionExpression=Key("record_type").eq(VAULT_RECORD_TYPE),
                 ScanIndexForward=False,
                 Limit=1,
             )
@@ -113,7 +160,11 @@ class DynamoDBService:
                 logger.error("No vault data found in DynamoDB item")
                 return False
 
-            cloud_bytes = base64.b64decode(vault_data.encode("ascii"))
+            if isinstance(vault_data, str):
+                # Items uploaded before vaults were stored as binary attributes
+                cloud_bytes = base64.b64decode(vault_data.encode("ascii"))
+            else:
+                cloud_bytes = bytes(vault_data)
 
             # Sync with local vault
             vault = Vault()
@@ -143,24 +194,29 @@ class DynamoDBService:
             Optional[list]: List of vault metadata or None if failed
         """
         try:
-            dynamodb = self.sts_service.get_resource_with_assumed_role("dynamodb")
-            table = dynamodb.Table(self.table_name)
+            dynamodb = self.sts_service.get_client_with_assumed_role("dynamodb")
+            paginator = dynamodb.get_paginator("query")
 
-            response = table.query(
+            pages = paginator.paginate(
+                TableName=self.table_name,
                 IndexName="TimestampIndex",
-                KeyConditionExpression=Key("record_type").eq("DATA_VAULT"),
+                KeyConditionExpression="record_type = :rt",
+                ExpressionAttributeValues={":rt": {"S": VAULT_RECORD_TYPE}},
+                ProjectionExpression="common_name, timestamp_ms, sk",
                 ScanIndexForward=False,
             )
 
+            # Pages are projected on worker threads while the paginator
+            # fetches the next page
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futures = [
+                    executor.submit(_project_vault_items, page.get("Items", []))
+                    for page in pages
+                ]
+
             vaults = []
-            for item in response.get("Items", []):
-                vaults.append(
-                    {
-                        "common_name": item.get("common_name"),
-                        "timestamp": item.get("timestamp_ms"),
-                        "record_id": item.get("sk"),
-                    }
-                )
+            for future in futures:
+                vaults.extend(future.result())
 
             return vaults
 
@@ -1,9 +1,11 @@
 """AWS STS service for role assumption."""
 
 import logging
-from typing import Optional
+import time
+from typing import Any, Dict, Optional, Tuple
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
 
 from lox.infrastructure.aws.models.credentials import AWSCredentials
@@ -12,6 +14,9 @@ from lox.infrastructure.aws.services.credential_service import \
 
 logger = logging.getLogger(__name__)
 
+# Refresh assumed-role credentials this many seconds before they expire
+CREDENTIAL_REFRESH_MARGIN = 300
+
 
 class STSAssumptionError(Exception):
     """Exception for STS role assumption failures."""
@@ -22,11 +27,29 @@ class STSAssumptionError(Exception):
 class STSService:
     """Service for AWS STS operations."""
 
+    _ERROR_TEMPLATES = {
+        "AccessDenied": "Access denied for role '{role_arn}'. Check permissions.",
+        "NoSuchEntity": "Role '{role_arn}' does not exist.",
+        "ExpiredToken": "Credentials have expired. Please run 'lox setup' again.",
+        "InvalidClientTokenId": "Invalid access key. Please run 'lox setup' again.",
+    }
+
     def __init__(
         self,
         credential_service: Optional[AWSCredentialService] = None,
     ):
         self.credential_service = credential_service or AWSCredentialService()
+        self._botocore_config = Config(
+            retries={"mode": "adaptive", "max_attempts": 5},
+            max_pool_connections=25,
+            tcp_keepalive=True,
+            connect_timeout=3,
+            read_timeout=10,
+        )
+        self._cached_creds: Optional[AWSCredentials] = None
+        self._cached_expiry: float = 0.0
+        self._session: Optional[boto3.Session] = None
+        self._client_cache: Dict[Tuple, Any] = {}
 
     def assume_role(
         self, role_session_name: str = "LoxPasswordManager"
@@ -34,12 +57,21 @@ class STSService:
         """
         Assume the configured IAM role and return temporary credentials.
 
+        Credentials are cached until shortly before they expire, so repeated
+        calls do not hit the keyring or STS again.
+
         Returns:
             AWSCredentials: Temporary credentials including session token
 
         Raises:
             STSAssumptionError: If role assumption fails
         """
+        if (
+            self._cached_creds is not None
+            and time.time() < self._cached_expiry - CREDENTIAL_REFRESH_MARGIN
+        ):
+            return self._cached_creds
+
         stored_data = self.credential_service.retrieve_credentials()
         if not stored_data:
             raise NoCredentialsError("No AWS credentials configured. Run 'lox setup'")
@@ -55,6 +87,7 @@ class STSService:
                 region_name=stored_creds.region,
                 aws_access_key_id=stored_creds.access_key,
                 aws_secret_access_key=stored_creds.secret_key,
+                config=self._botocore_config,
             )
 
             response = sts_client.assume_role(
@@ -64,12 +97,21 @@ class STSService:
             )
 
             creds = response["Credentials"]
-            return AWSCredentials(
+            self._cached_creds = AWSCredentials(
                 access_key=creds["AccessKeyId"],
                 secret_key=creds["SecretAccessKey"],
                 session_token=creds["SessionToken"],
                 region=stored_creds.region,
             )
+            self._cached_expiry = creds["Expiration"].timestamp()
+            self._session = boto3.Session(
+                aws_access_key_id=self._cached_creds.access_key,
+                aws_secret_access_key=self._cached_creds.secret_key,
+                aws_session_token=self._cached_creds.session_token,
+                region_name=self._cached_creds.region,
+            )
+            self._client_cache.clear()
+            return self._cached_creds
 
         except ClientError as e:
             error_code = e.response["Error"]["Code"]
@@ -83,13 +125,28 @@ class STSService:
 
     def _get_error_message(self, error_code: str, role_arn: str) -> str:
         """Get user-friendly error message for STS errors."""
-        error_messages = {
-            "AccessDenied": f"Access denied for role '{role_arn}'. Check permissions.",
-            "NoSuchEntity": f"Role '{role_arn}' does not exist.",
-            "ExpiredToken": "Credentials have expired. Please run 'lox setup' again.",
-            "InvalidClientTokenId": "Invalid access key. Please run 'lox setup' again.",
-        }
-        return error_messages.get(error_code, f"AWS error: {error_code}")
+        template = self._ERROR_TEMPLATES.get(error_code, "AWS error: {error_code}")
+        return template.format(role_arn=role_arn, error_code=error_code)
+
+    def _get_cached(self, kind: str, service_name: str, **kwargs):
+        """
+        Return a cached boto3 client/resource, building it on first use.
+
+        Clients and resources are created from one session bound to the
+        assumed-role credentials, so service models are loaded only once.
+        """
+        self.assume_role()
+        kwargs.setdefault("config", self._botocore_config)
+
+        cache_key = (kind, service_name, frozenset(kwargs.items()))
+        cached = self._client_cache.get(cache_key)
+        if cached is None:
+            if kind == "client":
+                cached = self._session.client(service_name, **kwargs)
+            else:
+                cached = self._session.resource(service_name, **kwargs)
+            self._client_cache[cache_key] = cached
+        return cached
 
     def get_client_with_assumed_role(self, service_name: str, **kwargs):
         """
@@ -102,16 +159,7 @@ class STSService:
         Returns:
             boto3 client configured with assumed role credentials
         """
-        temp_creds = self.assume_role()
-
-        return boto3.client(
-            service_name,
-            region_name=temp_creds.region,
-            aws_access_key_id=temp_creds.access_key,
-            aws_secret_access_key=temp_creds.secret_key,
-            aws_session_token=temp_creds.session_token,
-            **kwargs,
-        )
+        return self._get_cached("client", service_name, **kwargs)
 
     def get_resource_with_assumed_role(self, service_name: str, **kwargs):
         """
@@ -124,13 +172,4 @@ class STSService:
         Returns:
             boto3 resource configured with assumed role credentials
         """
-        temp_creds = self.assume_role()
-
-        return boto3.resource(
-            service_name,
-            region_name=temp_creds.region,
-            aws_access_key_id=temp_creds.access_key,
-            aws_secret_access_key=temp_creds.secret_key,
-            aws_session_token=temp_creds.session_token,
-            **kwargs,
-        )
+        return self._get_cached("resource", service_name, **kwargs)
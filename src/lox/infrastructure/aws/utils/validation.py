@@ -1,8 +1,16 @@
 """Validation utilities for AWS credentials and resources."""
 
 import re
+import string
 from typing import Dict, Optional
 
+_ROLE_ARN_PREFIX = "arn:aws:iam::"
+_ROLE_ARN_RE = re.compile(r"^arn:aws:iam::\d{12}:role/[\w+=,.@-]+$")
+_ACCESS_KEY_PREFIXES = ("AKIA", "ASIA")
+_ACCESS_KEY_CHARS = frozenset(string.ascii_uppercase + string.digits)
+_SECRET_KEY_CHARS = frozenset(string.ascii_letters + string.digits + "/+=")
+_REGION_RE = re.compile(r"^[a-z]{2}-[a-z]+-\d+$")
+
 
 def validate_aws_credentials(credentials: Dict) -> Optional[str]:
     """
@@ -43,23 +51,26 @@ def validate_aws_credentials(credentials: Dict) -> Optional[str]:
 
 def validate_aws_role_arn(role_arn: str) -> bool:
     """Validate AWS Role ARN format."""
-    pattern = r"^arn:aws:iam::\d{12}:role/[\w+=,.@-]+$"
-    return bool(re.match(pattern, role_arn))
+    return (
+        role_arn.startswith(_ROLE_ARN_PREFIX)
+        and _ROLE_ARN_RE.match(role_arn) is not None
+    )
 
 
 def validate_aws_access_key(access_key: str) -> bool:
     """Validate AWS Access Key ID format."""
-    pattern = r"^(AKIA|ASIA)[A-Z0-9]{16}$"
-    return bool(re.match(pattern, access_key))
+    return (
+        len(access_key) == 20
+        and access_key[:4] in _ACCESS_KEY_PREFIXES
+        and _ACCESS_KEY_CHARS.issuperset(access_key[4:])
+    )
 
 
 def validate_aws_secret_key(secret_key: str) -> bool:
     """Validate AWS Secret Access Key format."""
-    pattern = r"^[A-Za-z0-9/+=]{40}$"
-    return bool(re.match(pattern, secret_key))
+    return len(secret_key) == 40 and _SECRET_KEY_CHARS.issuperset(secret_key)
 
 
 def validate_aws_region(region_name: str) -> bool:
     """Validate AWS region name format."""
-    pattern = r"^[a-z]{2}-[a-z]+-\d+$"
-    return bool(re.match(pattern, region_name))
+    return _REGION_RE.match(region_name) is not None
@@ -5,6 +5,7 @@ from typing import Optional
 
 from .exceptions import (ClipboardError, ClipboardOperationError,
                          ClipboardUnavailableError)
+from .services.copykitten_service import COPYKITTEN_AVAILABLE
 from .services.manager import ClipboardManager
 
 logger = logging.getLogger(__name__)
@@ -67,16 +68,12 @@ def is_clipboard_available() -> bool:
     """
     Check if clipboard functionality is available.
 
+    Only checks that copykitten is installed, without importing it.
+
     Returns:
-        bool: True if copykitten is available and functional
+        bool: True if copykitten is installed
     """
-    try:
-        manager = get_clipboard_manager()
-        return manager.is_available()
-    except ClipboardUnavailableError:
-        return False
-    except Exception:
-        return False
+    return COPYKITTEN_AVAILABLE
 
 
 def get_clipboard_info() -> str:
@@ -95,9 +92,6 @@ def get_clipboard_info() -> str:
         return f"Clipboard service: Error ({e})"
 
 
-copy_to_clipboard = copy_to_clipboard
-
-
 __all__ = [
     "copy_to_clipboard",
     "is_clipboard_available",
@@ -1,17 +1,15 @@
 """CopyKitten clipboard service implementation."""
 
+import importlib.util
 import logging
 from typing import Optional
 
-try:
-    import copykitten
-
-    COPYKITTEN_AVAILABLE = True
-except ImportError:
-    COPYKITTEN_AVAILABLE = False
-
 from ..exceptions import ClipboardOperationError, ClipboardUnavailableError
 
+# copykitten links against the native clipboard libraries, so only check that
+# it is installed here and import it when the service is actually created.
+COPYKITTEN_AVAILABLE = importlib.util.find_spec("copykitten") is not None
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,6 +23,15 @@ class CopyKittenService:
                 "Please install it with: pip install copykitten"
             )
 
+        try:
+            import copykitten
+        except ImportError as e:
+            raise ClipboardUnavailableError(
+                f"copykitten is installed but could not be loaded: {e}"
+            ) from e
+
+        self._copykitten = copykitten
+        self._version_info: Optional[str] = None
         logger.info("CopyKitten clipboard service initialized")
 
     def copy(self, text: str) -> bool:
@@ -41,7 +48,7 @@ class CopyKittenService:
             ClipboardOperationError: If copy operation fails
         """
         try:
-            copykitten.copy(text)
+            self._copykitten.copy(text)
             logger.debug("Successfully copied text to clipboard")
             return True
         except Exception as e:
@@ -65,9 +72,14 @@ class CopyKittenService:
         Returns:
             Optional[str]: Version information or None if not available
         """
+        if self._version_info is not None:
+            return self._version_info
+
         try:
-            if hasattr(copykitten, "__version__"):
-                return f"copykitten v{copykitten.__version__}"
-            return "copykitten (version unknown)"
+            if hasattr(self._copykitten, "__version__"):
+                self._version_info = f"copykitten v{self._copykitten.__version__}"
+            else:
+                self._version_info = "copykitten (version unknown)"
+            return self._version_info
         except Exception:
             return None
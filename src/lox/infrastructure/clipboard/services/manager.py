@@ -13,7 +13,15 @@ class ClipboardManager:
 
     def __init__(self):
         self._service: Optional[CopyKittenService] = None
-        self._initialize_service()
+        self._initialized = False
+        self._service_info: Optional[str] = None
+
+    def _ensure_service(self) -> Optional[CopyKittenService]:
+        """Initialize the service on first use and return it."""
+        if not self._initialized:
+            self._initialize_service()
+            self._initialized = True
+        return self._service
 
     def _initialize_service(self) -> None:
         """Initialize the CopyKitten service."""
@@ -35,13 +43,14 @@ class ClipboardManager:
         Returns:
             bool: True if successful, False otherwise
         """
-        if not self._service:
+        service = self._ensure_service()
+        if not service:
             if not silent:
                 logger.error("Clipboard service not available")
             return False
 
         try:
-            return self._service.copy(text)
+            return service.copy(text)
         except ClipboardOperationError as e:
             if not silent:
                 logger.error("Clipboard copy failed: %s", e)
@@ -58,7 +67,8 @@ class ClipboardManager:
         Returns:
             bool: True if copykitten is available and functional
         """
-        return self._service is not None and self._service.is_available()
+        service = self._ensure_service()
+        return service is not None and service.is_available()
 
     def get_service_info(self) -> str:
         """
@@ -67,11 +77,16 @@ class ClipboardManager:
         Returns:
             str: Service information string
         """
-        if not self._service:
-            return "Clipboard service: Not available"
-
-        version_info = self._service.get_version_info() or "copykitten"
-        return f"Clipboard service: {version_info}"
+        if self._service_info is not None:
+            return self._service_info
+
+        service = self._ensure_service()
+        if not service:
+            self._service_info = "Clipboard service: Not available"
+        else:
+            version_info = service.get_version_info() or "copykitten"
+            self._service_info = f"Clipboard service: {version_info}"
+        return self._service_info
 
     @contextmanager
     def temporary_copy(self, text: str, silent: bool = False) -> None:
@@ -1,5 +1,6 @@
 """Clipboard setup and verification utilities."""
 
+import functools
 import logging
 from typing import Any, Dict
 
@@ -12,6 +13,9 @@ def verify_clipboard_setup() -> Dict[str, Any]:
     """
     Verify that clipboard functionality is properly set up.
 
+    The check writes to the system clipboard, so it only runs once per
+    process; later calls return a copy of the first result.
+
     Returns:
         Dict containing setup verification results
 
@@ -24,6 +28,12 @@ def verify_clipboard_setup() -> Dict[str, Any]:
             'test_message': 'Clipboard test passed'
         }
     """
+    return dict(_run_clipboard_check())
+
+
+@functools.lru_cache(maxsize=1)
+def _run_clipboard_check() -> Dict[str, Any]:
+    """Run the clipboard availability and copy test."""
     results = {
         "available": False,
         "info": "",
@@ -55,8 +65,17 @@ def verify_clipboard_setup() -> Dict[str, Any]:
         return results
 
 
-def print_clipboard_status() -> None:
-    """Print clipboard status information to console."""
+def print_clipboard_status(refresh: bool = False) -> None:
+    """
+    Print clipboard status information to console.
+
+    Args:
+        refresh: If True, re-run the clipboard check instead of using the
+            cached result
+    """
+    if refresh:
+        _run_clipboard_check.cache_clear()
+
     status = verify_clipboard_setup()
 
     print("📋 Clipboard Status")
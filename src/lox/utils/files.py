@@ -0,0 +1,35 @@
+"""File utilities shared by the vault and credential storage."""
+
+import os
+from pathlib import Path
+from typing import Union
+
+
+def atomic_write(path: Union[str, Path], payload: bytes, mode: int = 0o600) -> None:
+    """
+    Write payload to a file atomically.
+
+    The data is written to a private temporary sibling, flushed to disk and
+    then moved over the target, so a crash never leaves a partial file.
+    Symlinks are followed so the link target is replaced.
+
+    Args:
+        path: File to write
+        payload: Bytes to write
+        mode: Permission bits for the written file
+
+    Raises:
+        OSError: If the file cannot be written; the temporary file is removed
+    """
+    target = Path(path).resolve()
+    tmp_path = target.with_name(target.name + ".tmp")
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with open(fd, "wb", buffering=0) as f:
+            f.write(payload)
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, target)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
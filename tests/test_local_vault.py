@@ -0,0 +1,118 @@
+"""Tests for the local encrypted vault file format."""
+
+import pytest
+
+from lox.core.cryptography import derive_key_pbkdf2, encrypt_data
+from lox.core.exceptions import VaultOperationError
+from lox.core.storage import local_vault
+from lox.core.storage.local_vault import _V2_HEADER, VAULT_MAGIC, Vault
+
+VAULT_DATA = {"services": {"github": {"password": "s3cret"}}}
+
+
+@pytest.fixture
+def vault(tmp_path):
+    return Vault(str(tmp_path / "vault.enc"))
+
+
+@pytest.fixture
+def kdf_calls(monkeypatch):
+    """Count calls to the Argon2 and PBKDF2 key derivation functions."""
+    calls = {"argon2": 0, "pbkdf2": 0}
+
+    def counting(name, func):
+        def wrapper(*args, **kwargs):
+            calls[name] += 1
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    monkeypatch.setattr(
+        local_vault, "derive_key", counting("argon2", local_vault.derive_key)
+    )
+    monkeypatch.setattr(
+        local_vault,
+        "derive_key_pbkdf2",
+        counting("pbkdf2", local_vault.derive_key_pbkdf2),
+    )
+    return calls
+
+
+def write_v1_vault(vault, password):
+    key, salt = derive_key_pbkdf2(password)
+    token = encrypt_data('{"services": {"github": {"password": "s3cret"}}}', key)
+    vault.vault_path.write_bytes(len(salt).to_bytes(4, "big") + salt + token)
+
+
+def test_v2_round_trip(vault):
+    assert vault.save_vault(VAULT_DATA, "master")
+
+    assert vault.vault_path.read_bytes()[:4] == VAULT_MAGIC
+    assert Vault(str(vault.vault_path)).load_vault("master") == VAULT_DATA
+
+
+def test_legacy_v1_vault_loads_and_upgrades_on_save(vault):
+    write_v1_vault(vault, "master")
+
+    assert vault.load_vault("master") == VAULT_DATA
+
+    assert vault.save_vault(VAULT_DATA, "master")
+    assert vault.vault_path.read_bytes()[:4] == VAULT_MAGIC
+    assert Vault(str(vault.vault_path)).load_vault("master") == VAULT_DATA
+
+
+def test_wrong_password_raises(vault):
+    vault.save_vault(VAULT_DATA, "master")
+
+    with pytest.raises(VaultOperationError):
+        Vault(str(vault.vault_path)).load_vault("not the master")
+
+
+@pytest.mark.parametrize(
+    "time_cost, memory_cost, parallelism, salt_length",
+    [
+        (0, 65536, 2, 16),
+        (0xFFFFFFFF, 1 << 20, 1, 16),
+        (3, 65536, 0, 16),
+        (3, 1 << 17, 1 << 14, 16),
+        (3, 0, 2, 16),
+        (3, 1 << 30, 2, 16),
+        (3, 65536, 2, 4),
+        (3, 65536, 2, 1 << 20),
+    ],
+)
+def test_invalid_kdf_parameters_are_rejected(
+    vault, time_cost, memory_cost, parallelism, salt_length
+):
+    header = _V2_HEADER.pack(
+        VAULT_MAGIC, time_cost, memory_cost, parallelism, salt_length
+    )
+    vault.vault_path.write_bytes(header + bytes(16) + b"token")
+
+    with pytest.raises(VaultOperationError, match="Invalid vault header"):
+        vault.load_vault("master")
+
+
+def test_key_is_derived_once_per_instance(vault, kdf_calls):
+    vault.initialize_vault("master")
+    data = vault.load_vault("master")
+    vault.save_vault(data, "master")
+
+    assert kdf_calls == {"argon2": 1, "pbkdf2": 0}
+
+
+def test_v1_load_then_save_derives_fresh_argon2_key(vault, kdf_calls):
+    write_v1_vault(vault, "master")
+
+    vault.save_vault(vault.load_vault("master"), "master")
+
+    assert kdf_calls == {"argon2": 1, "pbkdf2": 1}
+    assert Vault(str(vault.vault_path)).load_vault("master") == VAULT_DATA
+
+
+def test_clear_key_cache_forces_new_derivation(vault, kdf_calls):
+    vault.initialize_vault("master")
+    vault.clear_key_cache()
+    vault.load_vault("master")
+
+    assert kdf_calls == {"argon2": 2, "pbkdf2": 0}